@@ -0,0 +1,230 @@
+"""In-process response cache for idempotent Azure DevOps GET requests."""
+import asyncio
+import functools
+import os
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .client import get_client, loads
+
+MAX_ENTRIES = 512
+# Blob texts vary from a few bytes to megabytes, so the in-memory copy is bounded
+# by total size (in characters) rather than by entry count.
+MAX_BLOB_CHARS = 64 * 1024 * 1024
+
+# Blobs also persist across restarts, so re-reviewing a PR in a new session only
+# downloads files that changed since. ADO_BLOB_CACHE moves the store to another
+# file, or disables it with "off" (e.g. on a read-only or shared home directory);
+# blobs are then only cached in memory.
+_CACHE_HOME = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+_BLOB_CACHE_SETTING = os.environ.get("ADO_BLOB_CACHE", "").strip()
+BLOB_DB_PATH: Optional[Path] = (
+    None if _BLOB_CACHE_SETTING.lower() == "off"
+    else Path(_BLOB_CACHE_SETTING).expanduser() if _BLOB_CACHE_SETTING
+    else _CACHE_HOME / "ado-mcp" / "blobs.sqlite"
+)
+# Upper bound on the (compressed) blob bytes kept on disk; once exceeded, the
+# oldest blobs are deleted until the store is back to PRUNE_TO of it.
+MAX_BLOB_DB_BYTES = 256 * 1024 * 1024
+PRUNE_TO = 0.75
+
+# How long a cached body is served without contacting Azure DevOps at all.
+# Data that changes while a PR is being reviewed (PR metadata, threads, iterations)
+# uses VOLATILE_TTL, i.e. it is always revalidated with its ETag.
+DEFAULT_TTL = 60.0
+STABLE_TTL = 300.0
+VOLATILE_TTL = 0.0
+
+# url -> (expires_at, etag, parsed JSON body); least recently used entries first
+_cache: "OrderedDict[str, Tuple[float, Optional[str], Any]]" = OrderedDict()
+
+# git object ID -> decoded blob text; object IDs are content hashes, so entries never go stale.
+# This is the in-memory front of the on-disk store at BLOB_DB_PATH.
+_blobs: "OrderedDict[str, str]" = OrderedDict()
+_blob_chars = 0  # total length of the texts in _blobs
+_blob_db_bytes = 0  # compressed bytes in the on-disk store, as last counted by this process
+
+# url -> request currently fetching it, shared by concurrent callers (single-flight)
+_inflight: "Dict[str, asyncio.Future[Any]]" = {}
+
+
+async def cached_get(url: str, ttl: float = DEFAULT_TTL) -> Any:
+    """
+    GET `url` and return the parsed JSON body, reusing a cached copy when possible.
+
+    - Within `ttl` seconds of the last fetch the cached body is returned without a request.
+    - Once expired, the request is revalidated with `If-None-Match`; a
+      `304 Not Modified` reuses the cached body instead of downloading and
+      parsing it again.
+    - Concurrent calls for the same URL share a single in-flight request.
+
+    Callers must treat the returned object as read-only, since it is shared
+    with later cache hits.
+    """
+    entry = _cache.get(url)
+    if entry is not None and time.monotonic() < entry[0]:
+        _cache.move_to_end(url)
+        return entry[2]
+
+    future = _inflight.get(url)
+    if future is None:
+        future = asyncio.ensure_future(_fetch(url, ttl))
+        _inflight[url] = future
+        future.add_done_callback(lambda done: _forget_inflight(url, done))
+
+    # Shielded so one cancelled caller does not cancel the request for the others
+    return await asyncio.shield(future)
+
+
+def _forget_inflight(url: str, future: "asyncio.Future[Any]") -> None:
+    if _inflight.get(url) is future:
+        del _inflight[url]
+
+
+async def _fetch(url: str, ttl: float) -> Any:
+    """Fetch (or revalidate) `url` and store the result in the cache."""
+    entry = _cache.get(url)
+    headers = {"If-None-Match": entry[1]} if entry is not None and entry[1] else None
+    resp = await get_client().get(url, headers=headers)
+
+    if resp.status_code == 304 and entry is not None:
+        etag, body = entry[1], entry[2]
+    else:
+        resp.raise_for_status()
+        etag, body = resp.headers.get("ETag"), loads(resp)
+
+    _cache[url] = (time.monotonic() + ttl, etag, body)
+    _cache.move_to_end(url)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+    return body
+
+
+def prime(url: str, body: Any, ttl: float) -> None:
+    """
+    Store `body` as the response of `url` for `ttl` seconds without requesting it.
+
+    Used when one response already contains what another endpoint would return.
+    No ETag is kept, so once `ttl` expires the URL is fetched in full again.
+    """
+    _cache[url] = (time.monotonic() + ttl, None, body)
+    _cache.move_to_end(url)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def invalidate(prefix: str = "") -> None:
+    """Drop every cached response whose URL starts with `prefix` (all of them by default)."""
+    for url in [url for url in _cache if url.startswith(prefix)]:
+        del _cache[url]
+
+
+@functools.cache
+def _blob_db() -> Optional[sqlite3.Connection]:
+    """Open the on-disk blob store once, or return None if it is disabled or cannot be used."""
+    global _blob_db_bytes
+    if BLOB_DB_PATH is None:
+        return None
+    try:
+        BLOB_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(BLOB_DB_PATH, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("CREATE TABLE IF NOT EXISTS blobs (oid TEXT PRIMARY KEY, text BLOB NOT NULL)")
+        _blob_db_bytes = _stored_blob_bytes(db)
+        return db
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _stored_blob_bytes(db: sqlite3.Connection) -> int:
+    return db.execute("SELECT COALESCE(SUM(LENGTH(text)), 0) FROM blobs").fetchone()[0]
+
+
+def _prune_blob_db(db: sqlite3.Connection) -> None:
+    """Delete the oldest blobs until the store is back to PRUNE_TO of MAX_BLOB_DB_BYTES."""
+    global _blob_db_bytes
+    # Recount first: other server processes may write to the same file
+    total = _stored_blob_bytes(db)
+    target = MAX_BLOB_DB_BYTES * PRUNE_TO
+    # rowids only grow (no row is ever updated), so rowid order is insertion order
+    last_rowid = None
+    for rowid, size in db.execute("SELECT rowid, LENGTH(text) FROM blobs ORDER BY rowid").fetchall():
+        if total <= target:
+            break
+        total -= size
+        last_rowid = rowid
+    if last_rowid is not None:
+        db.execute("DELETE FROM blobs WHERE rowid <= ?", (last_rowid,))
+    _blob_db_bytes = total
+
+
+def _remember_blob(object_id: str, text: str) -> None:
+    global _blob_chars
+    previous = _blobs.pop(object_id, None)
+    if previous is not None:
+        _blob_chars -= len(previous)
+    if len(text) > MAX_BLOB_CHARS:
+        return  # larger than the whole budget; the on-disk store still has it
+
+    _blobs[object_id] = text
+    _blob_chars += len(text)
+    while _blob_chars > MAX_BLOB_CHARS:
+        _, evicted = _blobs.popitem(last=False)
+        _blob_chars -= len(evicted)
+
+
+def get_blob(object_id: str) -> Optional[str]:
+    """Return the cached text of blob `object_id`, or None if it has not been fetched yet."""
+    global _blob_db_bytes
+    text = _blobs.get(object_id)
+    if text is not None:
+        _blobs.move_to_end(object_id)
+        return text
+
+    db = _blob_db()
+    if db is None:
+        return None
+    try:
+        row = db.execute("SELECT text FROM blobs WHERE oid = ?", (object_id,)).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+
+    try:
+        text = zlib.decompress(row[0]).decode("utf-8")
+    except (zlib.error, UnicodeDecodeError):
+        # Corrupt or truncated row: drop it so the blob is downloaded and stored again
+        try:
+            db.execute("DELETE FROM blobs WHERE oid = ?", (object_id,))
+            _blob_db_bytes -= len(row[0])
+        except sqlite3.Error:
+            pass
+        return None
+
+    _remember_blob(object_id, text)
+    return text
+
+
+def put_blob(object_id: str, text: str) -> None:
+    """Remember the text of blob `object_id` in memory and in the on-disk store."""
+    global _blob_db_bytes
+    _remember_blob(object_id, text)
+
+    db = _blob_db()
+    if db is None:
+        return
+    data = zlib.compress(text.encode("utf-8"))
+    try:
+        cursor = db.execute("INSERT OR IGNORE INTO blobs (oid, text) VALUES (?, ?)", (object_id, data))
+        if cursor.rowcount == 1:
+            _blob_db_bytes += len(data)
+            if _blob_db_bytes > MAX_BLOB_DB_BYTES:
+                _prune_blob_db(db)
+    except sqlite3.Error:
+        pass
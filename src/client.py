@@ -1,6 +1,105 @@
 """HTTP client for Azure DevOps API."""
+import base64
+import functools
+import ssl
+import threading
+from typing import Any, Optional
+
+import certifi
 import httpx
-from .config import ADO_PAT
+import orjson
+from .config import settings
+
+# The PAT never changes, so encode the Basic credential once instead of letting
+# httpx's auth flow re-encode it for every request.
+_token = base64.b64encode(f":{settings.pat}".encode()).decode()
+# Accept-Encoding is left to httpx: with the `brotli` extra installed it
+# advertises "gzip, deflate, br", so Azure DevOps can pick the smaller brotli
+# encoding for its JSON and blob bodies, and httpx decodes whatever comes back.
+headers = {"Authorization": f"Basic {_token}"}
+
+# Every tool talks to the same Azure DevOps host, so keep one HTTP/2 connection
+# warm and let concurrent requests multiplex over it instead of re-handshaking.
+limits = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60.0,
+)
+timeout = httpx.Timeout(30.0, connect=10.0)
+# Failed connection attempts (DNS, TCP, TLS) are retried before a tool call fails.
+# Only connecting is retried, never a sent request, so this is safe for POST/PATCH too.
+CONNECT_RETRIES = 2
+
+# Request bodies are serialized with `dumps()`, so the content type is set explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+JSON_PATCH_HEADERS = {"Content-Type": "application/json-patch+json"}
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """
+    Build the TLS context once per process.
+
+    Parsing the CA bundle costs a few milliseconds; sharing the context means a
+    re-created client (after `close_client()`) reuses it, along with its TLS session cache.
+    """
+    context = ssl.create_default_context(cafile=certifi.where())
+    context.set_alpn_protocols(["h2", "http/1.1"])
+    return context
+
+
+_client: Optional[httpx.AsyncClient] = None
+_lock = threading.Lock()
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client, creating it on first use.
+
+    Importing the tool modules (e.g. to list tool schemas) does not open sockets
+    or build an SSL context; that only happens once a tool actually calls Azure DevOps.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                transport = httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=limits,
+                    verify=_ssl_context(),
+                    retries=CONNECT_RETRIES,
+                )
+                _client = httpx.AsyncClient(headers=headers, timeout=timeout, transport=transport)
+    return _client
+
+
+async def warm_up() -> None:
+    """
+    Open a connection to Azure DevOps ahead of the first tool call.
+
+    The HEAD request pays DNS + TCP + TLS (+ HTTP/2 SETTINGS) up front, leaving a
+    keep-alive connection in the pool for the first real request. Failures are
+    ignored: the first tool call simply connects as it would have anyway.
+    """
+    try:
+        await get_client().head(settings.org_url, timeout=5.0)
+    except httpx.HTTPError:
+        pass
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client if it was ever created."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def loads(resp: httpx.Response) -> Any:
+    """Parse a JSON response body with orjson (faster than `resp.json()`'s stdlib parser)."""
+    return orjson.loads(resp.content)
+
 
-auth = ("", ADO_PAT)
-client = httpx.Client(auth=auth)
+def dumps(payload: Any) -> bytes:
+    """Serialize a request body with orjson (faster than httpx's stdlib `json=` encoding)."""
+    return orjson.dumps(payload)
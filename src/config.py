@@ -1,17 +1,89 @@
 """Configuration management for Azure DevOps MCP server."""
+import asyncio
+import functools
 import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from operator import itemgetter
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-load_dotenv()
 
-# Global MCP instance - accessible everywhere
-mcp = FastMCP("azure-devops-pr")
+@functools.cache
+def load_env() -> None:
+    """
+    Load variables from `.env` at most once per process.
+
+    When the environment already provides the PAT (the usual production setup),
+    the `.env` lookup is skipped entirely instead of walking the directory tree.
+    """
+    if not os.environ.get("ADO_PAT"):
+        load_dotenv(override=False)
+
+
+load_env()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm up the shared HTTP client on startup and release it on shutdown."""
+    # Imported here because the client module itself depends on this config.
+    from .client import close_client, warm_up
+
+    warm_up_task = asyncio.create_task(warm_up())
+    try:
+        yield
+    finally:
+        warm_up_task.cancel()
+        await close_client()
+
+
+# Global MCP instance - accessible everywhere.
+# Duplicate tool/resource names (e.g. two modules registering "policy://review")
+# fail at import instead of silently overwriting each other.
+mcp = FastMCP("azure-devops-pr", lifespan=lifespan, on_duplicate="error")
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Azure DevOps configuration, snapshotted from the environment once at import."""
+    org_url: str
+    project: str
+    pat: str  # PAT with Code / PR permissions
+
+
+REQUIRED_ENV_VARS = ("ADO_ORG_URL", "ADO_PROJECT", "ADO_PAT")
+
+
+def validate() -> None:
+    """
+    Exit with a message naming every required env var that is missing or empty.
+
+    Called from `server.main()` rather than at import, so code that imports the
+    modules without talking to Azure DevOps does not need credentials.
+    """
+    missing = [name for name in REQUIRED_ENV_VARS if not os.environ.get(name)]
+    if missing:
+        raise SystemExit(f"Missing env vars: {', '.join(missing)}")
+
+
+# Reads all required vars in one C-level call, in Settings field order
+_read_required = itemgetter(*REQUIRED_ENV_VARS)
+
+
+def _snapshot_settings() -> Settings:
+    """Snapshot the required env vars into `Settings` (empty strings for missing ones)."""
+    try:
+        return Settings(*_read_required(os.environ))
+    except KeyError:
+        # Missing vars are reported by validate(); importing must still work without them
+        return Settings(*(os.environ.get(name, "") for name in REQUIRED_ENV_VARS))
+
 
 # Azure DevOps configuration
-ADO_ORG_URL = os.getenv("ADO_ORG_URL")
-ADO_PROJECT = os.getenv("ADO_PROJECT")
-ADO_PAT = os.getenv("ADO_PAT")  # PAT with Code / PR permissions
+settings = _snapshot_settings()
 
-if not all([ADO_ORG_URL, ADO_PROJECT, ADO_PAT]):
-    raise SystemExit("Missing env vars: ADO_ORG_URL / ADO_PROJECT / ADO_PAT")
+# API roots, built once so each call only formats the variable tail of its URL
+PROJECTS_URL = f"{settings.org_url}/_apis/projects"
+GIT_REPOS_URL = f"{settings.org_url}/_apis/git/repositories"
+PROJECT_GIT_REPOS_URL = f"{settings.org_url}/{settings.project}/_apis/git/repositories"
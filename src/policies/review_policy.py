@@ -1,4 +1,5 @@
 """Review policy resource for Azure DevOps MCP server."""
+from fastmcp.resources import TextResource
 from ..config import mcp
 
 REVIEW_POLICY_TEXT = """
@@ -79,17 +80,19 @@ Do not assume or speculate about code that is not visible in the diff.
 
 The goal of this policy is to keep reviews **helpful, respectful, and efficient**,
 focusing on the changes that really matter.
-"""
-
-
-@mcp.resource(
-    uri="policy://review",
-    name="Review Policy",
-    description="Lightweight PR review policy that keeps feedback focused and avoids over-reviewing.",
+""".strip()
+
+
+# The policy is a constant, so register it as a static text resource: FastMCP
+# serves the stored string directly instead of inspecting and calling a function.
+# It stays `str` rather than `bytes`: FastMCP would serve bytes as a base64 blob
+# resource, which is larger on the wire than the text itself.
+mcp.add_resource(
+    TextResource(
+        uri="policy://review",
+        name="Review Policy",
+        description="Lightweight PR review policy that keeps feedback focused and avoids over-reviewing.",
+        mime_type="text/plain",
+        text=REVIEW_POLICY_TEXT,
+    )
 )
-def get_review_policy() -> str:
-    """
-    Provides the lightweight PR review policy text for this repository.
-    The client or LLM may load this resource before performing any PR review.
-    """
-    return REVIEW_POLICY_TEXT
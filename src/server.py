@@ -1,9 +1,11 @@
 """Main MCP server entry point."""
-from .config import mcp
+from .config import mcp, validate
 
 
 def main():
     """Entry point for the MCP server."""
+    validate()
+
     # Import all modules to trigger tool/resource registration
     from . import tools  # noqa: F401
     from . import policies  # noqa: F401
@@ -1,16 +1,134 @@
 """Pull request-related MCP tools."""
-from typing import Dict, Any, List, Optional
-from ..config import mcp, ADO_ORG_URL
-from ..client import client
-from ..utils.helpers import get_latest_iteration_id, get_blob_text
+import asyncio
+import difflib
+from operator import itemgetter
+from typing import AsyncIterator, Dict, Any, List, NamedTuple, Optional, Set
+from urllib.parse import quote
+from typing_extensions import NotRequired, TypedDict
+from ..config import mcp, settings, GIT_REPOS_URL
+from ..client import get_client, dumps, loads, JSON_HEADERS, JSON_PATCH_HEADERS
+from ..cache import cached_get, invalidate, prime, STABLE_TTL, VOLATILE_TTL
+from ..policies.review_policy import REVIEW_POLICY_TEXT
+from ..utils.helpers import get_latest_iteration_id, get_blob_texts, get_project_id, EMPTY, BINARY_BLOB, LARGE_BLOB
+
+# URL templates, built once at import; call sites only interpolate the ids.
+# Optional expansions (links, commits, work item refs) are switched off explicitly:
+# the tools never read them, so they would only add bytes to download and parse.
+_PR_LIST_URL = (
+    f"{GIT_REPOS_URL}/%s/pullrequests"
+    f"?searchCriteria.status=%s&searchCriteria.includeLinks=false&$top=%s&$skip=%s&api-version=7.1-preview.1"
+)
+# Every cached PR listing of a repo, whatever its status/top arguments
+_PR_LIST_PREFIX = f"{GIT_REPOS_URL}/%s/pullrequests?searchCriteria."
+_PR_CREATE_URL = f"{GIT_REPOS_URL}/%s/pullrequests?api-version=7.1-preview.1"
+_PR_URL = (
+    f"{GIT_REPOS_URL}/%s/pullrequests/%s"
+    f"?includeCommits=false&includeWorkItemRefs=false&api-version=7.1-preview.1"
+)
+_PR_UPDATE_URL = f"{GIT_REPOS_URL}/%s/pullRequests/%s?api-version=7.1-preview.1"
+_PR_CHANGES_URL = (
+    f"{GIT_REPOS_URL}/%s/pullRequests/%s/iterations/%s/changes?api-version=7.1-preview.1&$top=%s&$skip=%s"
+)
+_PR_THREADS_URL = f"{GIT_REPOS_URL}/%s/pullRequests/%s/threads?api-version=7.1-preview.1"
+_WORK_ITEM_URL = f"{settings.org_url}/%s/_apis/wit/workitems/%s?api-version=7.1-preview.3"
+
+
+# Largest $top requested per PR list page
+PR_LIST_PAGE_SIZE = 1000
+# PR list responses cut descriptions at this many characters
+LIST_DESCRIPTION_LIMIT = 400
+# How long a PR taken from a list response answers get_pull_request
+LISTED_PR_TTL = 30.0
+# Only the first few listed PRs are seeded into the shared response cache, so a
+# large listing cannot evict everything else cached there
+LISTED_PR_PRIME_LIMIT = 20
+
+
+# Return shapes. TypedDicts keep responses as plain dicts (no model instances or
+# validation pass per record) while still giving FastMCP a precise output schema.
+class PullRequestSummary(TypedDict):
+    id: int
+    title: str
+    status: str
+    createdBy: str
+    repoName: str
+    sourceBranch: str
+    targetBranch: str
+    # Only with list_pull_requests(detailed=True)
+    description: NotRequired[str]
+    createdByEmail: NotRequired[str]
+
+
+class PullRequestComment(TypedDict):
+    file: Optional[str]
+    line: Optional[int]
+    content: Optional[str]
+    author: Optional[str]
+    status: Optional[str]
+    threadId: Optional[int]
+    commentId: Optional[int]
+
+
+class PullRequestDiff(TypedDict):
+    diff: str
+    comments: List[PullRequestComment]
+
+
+class PullRequestReview(TypedDict):
+    details: str
+    diff: str
+    comments: List[PullRequestComment]
+    policy: str
+
+
+class CreatedPullRequest(TypedDict):
+    id: Optional[int]
+    url: Optional[str]
+    title: Optional[str]
+    status: Optional[str]
+    sourceBranch: Optional[str]
+    targetBranch: Optional[str]
+
+
+class PullRequestDescription(TypedDict):
+    id: Optional[int]
+    status: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+
+
+class WorkItemLinkResult(TypedDict):
+    success: bool
+    workItemId: int
+    prId: int
+    message: str
+
+
+# Required fields of a listed PR, read in one C-level call
+_PR_SUMMARY_FIELDS = itemgetter("pullRequestId", "title", "status", "createdBy", "repository")
+
+
+def _pr_summary(pr: Dict[str, Any]) -> PullRequestSummary:
+    pr_id, title, status, created_by, repository = _PR_SUMMARY_FIELDS(pr)
+    return {
+        "id": pr_id,
+        "title": title,
+        "status": status,
+        "createdBy": created_by["displayName"],
+        "repoName": repository["name"],
+        "sourceBranch": pr.get("sourceRefName", ""),
+        "targetBranch": pr.get("targetRefName", ""),
+    }
 
 
 @mcp.tool()
-def list_pull_requests(
+async def list_pull_requests(
         repo_id: str,
         status: str = "active",
         top: int = 10,
-) -> List[Dict[str, Any]]:
+        skip: int = 0,
+        detailed: bool = False,
+) -> List[PullRequestSummary]:
     """
         List pull requests for a specific Azure DevOps repository and return structured metadata.
 
@@ -32,7 +150,15 @@ def list_pull_requests(
             The string is passed directly to Azure DevOps as `searchCriteria.status`.
         - top:
             Maximum number of PRs to return. This is useful to avoid overwhelming the LLM with
-            a very large list. Defaults to 10.
+            a very large list. Defaults to 10. Larger values are fetched in pages of
+            1000 internally, so one call can return any number of PRs.
+        - skip:
+            Number of PRs to skip before the first one returned (for paging through
+            results across calls). Defaults to 0.
+        - detailed:
+            Also return each PR's description and author email. Use this instead of
+            calling `get_pull_request` for every PR when summarizing several PRs.
+            Defaults to False.
 
         Returns:
         - A list of dictionaries. Each dictionary has the structure:
@@ -45,6 +171,9 @@ def list_pull_requests(
               "sourceBranch": <str>,     # e.g. "refs/heads/feature/foo"
               "targetBranch": <str>,     # e.g. "refs/heads/main"
             }
+          With `detailed=True` each entry also has:
+              "description": <str>,      # first 400 characters of the PR description
+              "createdByEmail": <str>,   # unique name of the author
 
         How an LLM should use this:
         - Call this tool when the user says things like:
@@ -54,41 +183,39 @@ def list_pull_requests(
         - When the user picks a PR (by `id` or title), pass its `id` into `get_pull_request`
           or `get_pull_request_full_diff` for deeper inspection.
     """
-    url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/pullrequests"
-        f"?searchCriteria.status={status}"
-        f"&$top={top}"
-        f"&api-version=7.1-preview.1"
-    )
-
-    resp = client.get(url)
-    resp.raise_for_status()
-
-    data = resp.json()
-    prs = data.get("value", [])
+    # PR state changes while it is being reviewed, so always revalidate (ETag).
+    # Pages are requested one at a time: a page shorter than its $top is the last
+    # one, so a large `top` on a small repo costs a single request.
+    prs: List[Dict[str, Any]] = []
+    for offset in range(0, top, PR_LIST_PAGE_SIZE):
+        page_size = min(PR_LIST_PAGE_SIZE, top - offset)
+        page = await cached_get(
+            _PR_LIST_URL % (repo_id, quote(status), page_size, skip + offset), ttl=VOLATILE_TTL
+        )
+        values = page.get("value", [])
+        prs.extend(values)
+        if len(values) < page_size:
+            break
 
-    if not prs:
-        return []
+    # Listed PRs are commonly opened next with get_pull_request; seed its cache
+    # entry so that call needs no request. The list truncates long descriptions,
+    # so only PRs whose description is known to be complete are seeded.
+    for pr in prs[:LISTED_PR_PRIME_LIMIT]:
+        if len(pr.get("description") or "") < LIST_DESCRIPTION_LIMIT:
+            prime(_PR_URL % (repo_id, pr["pullRequestId"]), pr, ttl=LISTED_PR_TTL)
 
-    result: List[Dict[str, Any]] = []
-    for pr in prs:
-        result.append(
-            {
-                "id": pr["pullRequestId"],
-                "title": pr["title"],
-                "status": pr["status"],
-                "createdBy": pr["createdBy"]["displayName"],
-                "repoName": pr["repository"]["name"],
-                "sourceBranch": pr.get("sourceRefName", ""),
-                "targetBranch": pr.get("targetRefName", ""),
-            }
-        )
+    summaries = list(map(_pr_summary, prs))
+    if detailed:
+        # The list response already carries these; no per-PR request is needed
+        for summary, pr in zip(summaries, prs):
+            summary["description"] = pr.get("description", "")
+            summary["createdByEmail"] = pr["createdBy"].get("uniqueName", "")
 
-    return result
+    return summaries
 
 
 @mcp.tool()
-def get_pull_request(repo_id: str, pr_id: int) -> str:
+async def get_pull_request(repo_id: str, pr_id: int) -> str:
     """
         Retrieve detailed, human-readable information about a specific pull request.
 
@@ -118,13 +245,8 @@ def get_pull_request(repo_id: str, pr_id: int) -> str:
             - Explain to the user what the PR is about and what it changes conceptually.
             - Decide whether a full code diff analysis (`get_pull_request_full_diff`) is needed.
     """
-    url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/pullrequests/{pr_id}"
-        f"?api-version=7.1-preview.1"
-    )
-    resp = client.get(url)
-    resp.raise_for_status()
-    pr = resp.json()
+    url = _PR_URL % (repo_id, pr_id)
+    pr = await cached_get(url, ttl=VOLATILE_TTL)
 
     details = (
         f"PR #{pr['pullRequestId']}: {pr['title']}\n"
@@ -138,8 +260,165 @@ def get_pull_request(repo_id: str, pr_id: int) -> str:
     return details
 
 
+# Change entries requested per page of an iteration's change list
+CHANGES_PAGE_SIZE = 200
+
+
+class _FileChange(NamedTuple):
+    path: str
+    original_path: str  # differs from `path` for renames
+    change_type: str
+    original_id: Optional[str]  # None for added files
+    new_id: Optional[str]  # None for deleted files
+
+
+def _unified_file_diff(change: _FileChange, original_text: str, modified_text: str) -> str:
+    """Render one changed file as a unified diff section with 3 lines of context."""
+    header = f"diff --git a{change.original_path} b{change.path} ({change.change_type})\n"
+
+    # get_blob_texts() hands out these stand-ins instead of the file contents
+    if LARGE_BLOB in (original_text, modified_text):
+        return f"{header}<file too large, skipped>\n"
+    if BINARY_BLOB in (original_text, modified_text):
+        return f"{header}<binary file, skipped>\n"
+
+    hunks = difflib.unified_diff(
+        original_text.splitlines(),
+        modified_text.splitlines(),
+        fromfile=f"a{change.original_path}" if change.original_id else "/dev/null",
+        tofile=f"b{change.path}" if change.new_id else "/dev/null",
+        n=3,
+        lineterm="",
+    )
+    body = "\n".join(hunks)
+    return f"{header}{body}\n" if body else f"{header}<no content changes>\n"
+
+
+async def _iter_change_pages(repo_id: str, pr_id: int, iteration_id: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield the change entries of a PR iteration, CHANGES_PAGE_SIZE entries at a time."""
+    skip = 0
+    while True:
+        url = _PR_CHANGES_URL % (repo_id, pr_id, iteration_id, CHANGES_PAGE_SIZE, skip)
+        # The change list of a given iteration never changes once the iteration exists
+        data = await cached_get(url, ttl=STABLE_TTL)
+        entries = data.get("changeEntries") or data.get("changes") or []
+        # Drop malformed entries once up front so callers need no type checks
+        yield [change for change in entries if isinstance(change, dict)]
+
+        # nextTop/nextSkip are zero (or absent) once the last page has been returned
+        if not data.get("nextTop"):
+            return
+        skip = data.get("nextSkip") or skip + len(entries)
+
+
+def _file_change(change: Dict[str, Any]) -> _FileChange:
+    """Extract the paths, change type and blob object IDs of one change entry."""
+    item = change.get("item") or EMPTY
+    path = item.get("path", "<unknown-path>")
+    change_type = change.get("changeType", "?")
+    original_id = item.get("originalObjectId")
+    new_id = item.get("objectId")
+
+    # changeType is a flag list such as "edit, rename"; an added file has no
+    # original side and a deleted one no modified side worth downloading.
+    # Flags are compared whole, so e.g. "undelete" does not count as "delete".
+    kinds = {kind.strip() for kind in change_type.lower().split(",")}
+    if "add" in kinds:
+        original_id = None
+    if "delete" in kinds:
+        new_id = None
+
+    return _FileChange(path, change.get("originalPath") or path, change_type, original_id, new_id)
+
+
+async def _fetch_unified_diff(repo_id: str, pr_id: int) -> str:
+    """Build the unified-style diff text for the latest iteration of a PR."""
+    # 1. Get latest iteration id
+    iteration_id = await get_latest_iteration_id(repo_id, pr_id)
+
+    # 2. Fetch changes for that iteration page by page; each page's blobs are
+    # requested while the next page is still being fetched.
+    changes: List[_FileChange] = []
+    blob_batches = []
+    # Object IDs already requested: an unmodified side of a rename, or identical
+    # content in several files (e.g. generated code), is downloaded only once.
+    requested: Set[str] = set()
+    try:
+        async for page in _iter_change_pages(repo_id, pr_id, iteration_id):
+            page_changes = [_file_change(change) for change in page]
+            changes.extend(page_changes)
+            # 3. Fetch every new blob of the page in one batch request. Renames and
+            # mode-only changes keep the same object ID and have nothing to diff.
+            object_ids = {
+                object_id
+                for change in page_changes
+                if change.original_id != change.new_id
+                for object_id in (change.original_id, change.new_id)
+                if object_id and object_id not in requested
+            }
+            requested |= object_ids
+            blob_batches.append(asyncio.create_task(get_blob_texts(repo_id, object_ids)))
+
+        batches = await asyncio.gather(*blob_batches)
+    except BaseException:
+        # A failed page (or batch, or cancellation of this call) leaves nobody to
+        # use the other batches: stop them and collect their outcomes, so they do not
+        # keep downloading or log "Task exception was never retrieved".
+        for task in blob_batches:
+            task.cancel()
+        await asyncio.gather(*blob_batches, return_exceptions=True)
+        raise
+
+    blobs: Dict[str, str] = {}
+    for batch in batches:
+        blobs.update(batch)
+
+    if not changes:
+        return f"No change entries found for PR #{pr_id}."
+
+    unified_parts = [
+        _unified_file_diff(change, blobs.get(change.original_id, ""), blobs.get(change.new_id, ""))
+        for change in changes
+    ]
+
+    return "\n".join(unified_parts)
+
+
+def _thread_line(thread_context: Dict[str, Any]) -> Optional[int]:
+    """Line a thread is anchored to: the right (modified) side if set, else the left."""
+    line = (thread_context.get("rightFileStart") or EMPTY).get("line")
+    return (thread_context.get("leftFileStart") or EMPTY).get("line") if line is None else line
+
+
+async def _fetch_comments(repo_id: str, pr_id: int) -> List[PullRequestComment]:
+    """Fetch all PR threads and flatten them into one entry per comment."""
+    threads_url = _PR_THREADS_URL % (repo_id, pr_id)
+
+    threads_data = await cached_get(threads_url, ttl=VOLATILE_TTL)
+    threads = threads_data.get("value", [])
+
+    return [
+        {
+            "file": thread_context.get("filePath"),
+            "line": _thread_line(thread_context),
+            "content": c.get("content"),
+            "author": (c.get("author") or EMPTY).get("displayName"),
+            "status": thread.get("status"),
+            "threadId": thread.get("id"),
+            "commentId": c.get("id"),
+        }
+        for thread in threads
+        for thread_context in (thread.get("threadContext") or EMPTY,)
+        for c in thread.get("comments", [])
+    ]
+
+
 @mcp.tool()
-def get_pull_request_full_diff(repo_id: str, pr_id: int) -> Dict[str, Any]:
+async def get_pull_request_full_diff(
+    repo_id: str,
+    pr_id: int,
+    include_comments: bool = True,
+) -> PullRequestDiff:
     """
         Fetch the full unified diff and all existing review comments for a pull request.
 
@@ -147,10 +426,11 @@ def get_pull_request_full_diff(repo_id: str, pr_id: int) -> Dict[str, Any]:
         ----------------------
         This tool returns a dictionary with two keys:
 
-          1) unified_diff:
-                A unified-style diff for the latest PR iteration, including full
-                ORIGINAL and MODIFIED file contents for each changed file. This is the
-                authoritative representation of what changed in the PR.
+          1) diff:
+                A unified diff (3 lines of context) for the latest PR iteration,
+                one section per changed file. Binary files and files larger than
+                512 KB are listed with a "skipped" marker instead of a diff. This is
+                the authoritative representation of what changed in the PR.
 
           2) comments:
                 A complete list of review comments on the PR:
@@ -158,6 +438,8 @@ def get_pull_request_full_diff(repo_id: str, pr_id: int) -> Dict[str, Any]:
                     - threaded discussion comments
                     - general PR comments
                 Each entry includes author, content, thread information, and status.
+                Empty when `include_comments=False`; pass that when only the code
+                changes are needed (e.g. "summarize this diff") to skip the threads request.
 
         This combined payload provides all context required for a complete code review.
 
@@ -165,7 +447,8 @@ def get_pull_request_full_diff(repo_id: str, pr_id: int) -> Dict[str, Any]:
         ------------------------------
         When performing a PR review, the LLM must follow this sequence:
 
-        1. **Call `get_review_policy()` first.**
+        1. **Load the review policy first** (the `policy://review` resource, or use
+           `review_pull_request`, which includes it).
            The review policy defines the mandatory conventions, expectations, and
            evaluation criteria for this repository.
            The LLM is required to load and apply these rules before analyzing any diff.
@@ -206,106 +489,65 @@ def get_pull_request_full_diff(repo_id: str, pr_id: int) -> Dict[str, Any]:
         - The diff always represents the latest PR iteration.
         - Comments include active, resolved, and general PR discussions.
         - This tool is typically used together with:
-              • get_review_policy()        — required before generating the review
+              • policy://review resource   — required before generating the review
               • get_pull_request()         — provides PR metadata
         - The LLM must treat the review policy as binding and must not skip any required sections.
     """
 
-    # 1. Get latest iteration id
-    iteration_id = get_latest_iteration_id(repo_id, pr_id)
+    if not include_comments:
+        return {
+            "diff": await _fetch_unified_diff(repo_id, pr_id),
+            "comments": [],
+        }
 
-    # 2. Fetch changes for that iteration
-    url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/pullRequests/{pr_id}/iterations/{iteration_id}/changes"
-        f"?api-version=7.1-preview.1&$top=1000"
+    # The comments do not depend on the iteration/changes/blobs chain, so both
+    # halves run concurrently and the tool waits only for the slower one.
+    diff_text, comments_out = await asyncio.gather(
+        _fetch_unified_diff(repo_id, pr_id),
+        _fetch_comments(repo_id, pr_id),
     )
 
-    resp = client.get(url)
-    resp.raise_for_status()
-
-    data = resp.json()
-    entries = data.get("changeEntries") or data.get("changes") or []
-
-    unified_parts: List[str] = []
-
-    if not entries:
-        diff_text = f"No change entries found for PR #{pr_id}."
-    else:
-        for change in entries:
-            if not isinstance(change, dict):
-                continue
-
-            item = change.get("item") or {}
-            path = item.get("path", "<unknown-path>")
-            change_type = change.get("changeType", "?")
+    return {
+        "diff": diff_text,
+        "comments": comments_out,
+    }
 
-            # object IDs are under item
-            original_id = item.get("originalObjectId")  # may be None for added files
-            new_id = item.get("objectId")  # current version
 
-            original_text = get_blob_text(repo_id, original_id) if original_id else ""
-            modified_text = get_blob_text(repo_id, new_id) if new_id else ""
+@mcp.tool()
+async def review_pull_request(repo_id: str, pr_id: int) -> PullRequestReview:
+    """
+        Fetch everything needed to review a pull request in a single call.
 
-            unified_parts.append(
-                f"--- a{path}\n"
-                f"+++ b{path}\n"
-                f"@@ {change_type} {path} @@\n"
-                f"--- ORIGINAL ---\n{original_text}\n"
-                f"--- MODIFIED ---\n{modified_text}\n"
-            )
+        Equivalent to reading the `policy://review` resource and calling
+        `get_pull_request()` and `get_pull_request_full_diff()` one after another,
+        but the Azure DevOps requests behind them run concurrently.
 
-        diff_text = "\n".join(unified_parts)
+        Returns a dictionary with:
+        - details:  PR metadata text, as returned by `get_pull_request`
+        - diff:     unified diff of the latest iteration, as in `get_pull_request_full_diff`
+        - comments: all existing review comments, as in `get_pull_request_full_diff`
+        - policy:   the review policy text (`policy://review`)
 
-    # 3. Fetch all PR threads (comments)
-    threads_url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/pullRequests/{pr_id}/threads"
-        f"?api-version=7.1-preview.1"
+        How an LLM should use this:
+        - Prefer this tool when the user asks to "review PR #123"; follow the policy
+          exactly as described for `get_pull_request_full_diff`.
+        - Use the granular tools when only one of the parts is needed.
+    """
+    details, diff = await asyncio.gather(
+        get_pull_request(repo_id, pr_id),
+        get_pull_request_full_diff(repo_id, pr_id),
     )
 
-    threads_resp = client.get(threads_url)
-    threads_resp.raise_for_status()
-    threads_data = threads_resp.json()
-    threads = threads_data.get("value", [])
-
-    comments_out: List[Dict[str, Any]] = []
-
-    for thread in threads:
-        thread_context = thread.get("threadContext") or {}
-        file_path = thread_context.get("filePath")
-        line = None
-
-        right_start = thread_context.get("rightFileStart") or {}
-        left_start = thread_context.get("leftFileStart") or {}
-
-        if right_start.get("line") is not None:
-            line = right_start.get("line")
-        elif left_start.get("line") is not None:
-            line = left_start.get("line")
-
-        thread_status = thread.get("status")
-        thread_id = thread.get("id")
-
-        for c in thread.get("comments", []):
-            comments_out.append(
-                {
-                    "file": file_path,
-                    "line": line,
-                    "content": c.get("content"),
-                    "author": (c.get("author") or {}).get("displayName"),
-                    "status": thread_status,
-                    "threadId": thread_id,
-                    "commentId": c.get("id"),
-                }
-            )
-
     return {
-        "diff": diff_text,
-        "comments": comments_out,
+        "details": details,
+        "diff": diff["diff"],
+        "comments": diff["comments"],
+        "policy": REVIEW_POLICY_TEXT,
     }
 
 
 @mcp.tool()
-def add_pull_request_comment(
+async def add_pull_request_comment(
         repo_id: str,
         pr_id: int,
         comment: str,
@@ -321,10 +563,7 @@ def add_pull_request_comment(
         If `file_path` and `line` are omitted, the comment will be created as a
         top-level PR thread (not attached to a specific file).
     """
-    url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/pullRequests/{pr_id}/threads"
-        f"?api-version=7.1-preview.1"
-    )
+    url = _PR_THREADS_URL % (repo_id, pr_id)
 
     thread_context = None
     if file_path is not None and line is not None:
@@ -349,15 +588,17 @@ def add_pull_request_comment(
     if thread_context is not None:
         payload["threadContext"] = thread_context
 
-    resp = client.post(url, json=payload)
+    resp = await get_client().post(url, content=dumps(payload), headers=JSON_HEADERS)
     resp.raise_for_status()
+    # `url` is also the cached threads listing of this PR
+    invalidate(url)
 
-    data = resp.json()
+    data = loads(resp)
     thread_id = data.get("id")
     return f"Comment posted in thread id {thread_id}"
 
 @mcp.tool()
-def create_pull_request(
+async def create_pull_request(
     repo_id: str,
     source_branch: str,
     target_branch: str,
@@ -365,7 +606,7 @@ def create_pull_request(
     description: Optional[str] = None,
     reviewers: Optional[List[str]] = None,
     is_draft: bool = False,
-) -> Dict[str, Any]:
+) -> CreatedPullRequest:
     """
     Create a new pull request in Azure DevOps.
 
@@ -410,7 +651,7 @@ def create_pull_request(
 
     Returns:
     --------
-    Dict[str, Any]
+    CreatedPullRequest
         A dictionary containing the created PR details:
         - id: The pull request ID
         - url: Direct URL to the pull request
@@ -436,10 +677,7 @@ def create_pull_request(
             is_draft=False
         )
     """
-    url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/pullrequests"
-        f"?api-version=7.1-preview.1"
-    )
+    url = _PR_CREATE_URL % repo_id
 
     # Ensure branches have refs/heads/ prefix
     if not source_branch.startswith("refs/"):
@@ -465,14 +703,15 @@ def create_pull_request(
             {"id": reviewer, "isRequired": True} for reviewer in reviewers
         ]
 
-    resp = client.post(url, json=payload)
+    resp = await get_client().post(url, content=dumps(payload), headers=JSON_HEADERS)
     resp.raise_for_status()
+    invalidate(_PR_LIST_PREFIX % repo_id)
 
-    pr = resp.json()
+    pr = loads(resp)
 
     return {
         "id": pr.get("pullRequestId"),
-        "url": pr.get("_links", {}).get("web", {}).get("href"),
+        "url": ((pr.get("_links") or EMPTY).get("web") or EMPTY).get("href"),
         "title": pr.get("title"),
         "status": pr.get("status"),
         "sourceBranch": pr.get("sourceRefName"),
@@ -481,7 +720,7 @@ def create_pull_request(
 
 
 @mcp.tool()
-def set_pr_description(repo_id: str, pr_id: int, description_markdown: str) -> Dict[str, Any]:
+async def set_pr_description(repo_id: str, pr_id: int, description_markdown: str) -> PullRequestDescription:
     """
     Update the Azure DevOps PR description with the provided Markdown text.
 
@@ -578,19 +817,17 @@ def set_pr_description(repo_id: str, pr_id: int, description_markdown: str) -> D
     """
 
 
-    url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/pullRequests/{pr_id}"
-        f"?api-version=7.1-preview.1"
-    )
+    url = _PR_UPDATE_URL % (repo_id, pr_id)
 
     payload = {
         "description": description_markdown,
     }
 
-    resp = client.patch(url, json=payload)
+    resp = await get_client().patch(url, content=dumps(payload), headers=JSON_HEADERS)
     resp.raise_for_status()
+    invalidate(_PR_URL % (repo_id, pr_id))
 
-    pr = resp.json()
+    pr = loads(resp)
 
     # Return a small summary so the LLM/user can confirm the update
     return {
@@ -602,12 +839,12 @@ def set_pr_description(repo_id: str, pr_id: int, description_markdown: str) -> D
 
 
 @mcp.tool()
-def link_pr_to_work_item(
+async def link_pr_to_work_item(
     project: str,
     repo_id: str,
     pr_id: int,
     work_item_id: int,
-) -> Dict[str, Any]:
+) -> WorkItemLinkResult:
     """
     Link a pull request to a work item in Azure DevOps.
 
@@ -631,7 +868,7 @@ def link_pr_to_work_item(
 
     Returns:
     --------
-    Dict[str, Any]
+    WorkItemLinkResult
         A dictionary containing:
         - success: True if the link was created
         - workItemId: The linked work item ID
@@ -656,19 +893,13 @@ def link_pr_to_work_item(
     # The PR artifact URI format is: vstfs:///Git/PullRequestId/{projectId}%2F{repoId}%2F{prId}
 
     # First, get the project ID
-    project_url = f"{ADO_ORG_URL}/_apis/projects/{project}?api-version=7.1-preview.4"
-    project_resp = client.get(project_url)
-    project_resp.raise_for_status()
-    project_id = project_resp.json().get("id")
+    project_id = await get_project_id(project)
 
     # Build the artifact URI for the PR
     artifact_uri = f"vstfs:///Git/PullRequestId/{project_id}%2F{repo_id}%2F{pr_id}"
 
     # Update work item with the artifact link using JSON Patch
-    work_item_url = (
-        f"{ADO_ORG_URL}/{project}/_apis/wit/workitems/{work_item_id}"
-        f"?api-version=7.1-preview.3"
-    )
+    work_item_url = _WORK_ITEM_URL % (quote(project), work_item_id)
 
     payload = [
         {
@@ -684,9 +915,7 @@ def link_pr_to_work_item(
         }
     ]
 
-    headers = {"Content-Type": "application/json-patch+json"}
-
-    resp = client.patch(work_item_url, json=payload, headers=headers)
+    resp = await get_client().patch(work_item_url, content=dumps(payload), headers=JSON_PATCH_HEADERS)
     resp.raise_for_status()
 
     return {
@@ -1,12 +1,69 @@
 """Repository-related MCP tools."""
-from typing import List, Dict, Any, Optional
-from ..config import mcp, ADO_ORG_URL
-from ..client import client
-from ..utils.helpers import resolve_repo_id_internal
+import asyncio
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+import httpx
+from typing_extensions import NotRequired, TypedDict
+from ..config import mcp, GIT_REPOS_URL, PROJECTS_URL
+from ..cache import cached_get, STABLE_TTL
+from ..utils.helpers import resolve_repo_id_internal, EMPTY
+
+
+class Project(TypedDict):
+    name: Optional[str]
+    id: Optional[str]
+    description: Optional[str]
+    state: Optional[str]
+
+
+class Branch(TypedDict):
+    name: str
+    fullName: str
+    isDefault: bool
+    creator: Optional[str]
+    objectId: Optional[str]
+    # Only with list_branches(include_counts=True)
+    aheadCount: NotRequired[Optional[int]]
+    behindCount: NotRequired[Optional[int]]
+
+
+# Ahead/behind counts of every branch against the default branch, in one request.
+# The server computes them for the whole repository, so they are only fetched on
+# request and cached like other slow-changing data.
+_BRANCH_STATS_URL = f"{GIT_REPOS_URL}/%s/stats/branches?api-version=7.1-preview.1"
+
+
+async def _branch_stats(repo_id: str) -> Dict[str, Dict[str, Any]]:
+    """Map short branch names to their stats; empty if the stats are unavailable."""
+    try:
+        data = await cached_get(_BRANCH_STATS_URL % repo_id, ttl=STABLE_TTL)
+    except httpx.HTTPError:
+        # The counts are optional extras; the branch list must not fail because of them
+        return {}
+    return {
+        stats["name"]: stats
+        for stats in data.get("value", [])
+        if isinstance(stats, dict) and stats.get("name")
+    }
+
+
+def _branch(ref: Dict[str, Any]) -> Branch:
+    full_name = ref.get("name", "")
+    # Extract short name from refs/heads/xxx
+    short_name = full_name.replace("refs/heads/", "") if full_name.startswith("refs/heads/") else full_name
+    creator = ref.get("creator")
+
+    return {
+        "name": short_name,
+        "fullName": full_name,
+        "isDefault": ref.get("isDefault", False),
+        "creator": creator.get("displayName") if creator else None,
+        "objectId": ref.get("objectId"),  # commit SHA
+    }
 
 
 @mcp.tool()
-def list_projects() -> List[Dict[str, Any]]:
+async def list_projects() -> List[Project]:
     """
     List all Azure DevOps projects you have access to.
 
@@ -15,7 +72,7 @@ def list_projects() -> List[Dict[str, Any]]:
 
     Returns:
     --------
-    List[Dict[str, Any]]
+    List[Project]
         A list of projects, each containing:
         - name: The project name (use this for create_product_backlog_item, create_bug)
         - id: The project GUID
@@ -29,28 +86,24 @@ def list_projects() -> List[Dict[str, Any]]:
         "What projects do I have access to?"
         "Show me available projects"
     """
-    url = f"{ADO_ORG_URL}/_apis/projects?api-version=7.1-preview.4"
+    url = f"{PROJECTS_URL}?api-version=7.1-preview.4"
 
-    resp = client.get(url)
-    resp.raise_for_status()
-
-    data = resp.json()
+    data = await cached_get(url, ttl=STABLE_TTL)
     projects = data.get("value", [])
 
-    result: List[Dict[str, Any]] = []
-    for proj in projects:
-        result.append({
+    return [
+        {
             "name": proj.get("name"),
             "id": proj.get("id"),
             "description": proj.get("description"),
             "state": proj.get("state"),
-        })
-
-    return result
+        }
+        for proj in projects
+    ]
 
 
 @mcp.tool()
-def resolve_repo_id(repo_key: str, project: Optional[str] = None) -> str:
+async def resolve_repo_id(repo_key: str, project: Optional[str] = None) -> str:
     """
         Resolve an Azure DevOps Git repository identifier into a canonical GUID.
 
@@ -59,14 +112,18 @@ def resolve_repo_id(repo_key: str, project: Optional[str] = None) -> str:
 
         Behavior:
         - If `repo_key` already looks like a GUID (36-char hex with dashes), it is returned as-is.
-        - Otherwise, the tool calls the Azure DevOps "list repositories" API for the configured
-          `ADO_PROJECT` and tries to find a repository whose `name` matches `repo_key` exactly.
+        - Otherwise, the tool looks the name up with the Azure DevOps "get repository" API
+          (`GET /repositories/{name}`) in the configured `ADO_PROJECT`. Names match
+          case-insensitively, so "Road-API" and "road-api" resolve to the same repository.
         - If a matching repo is found, its `id` (GUID) is returned.
-        - If no repo is found, the tool raises an error (the MCP host will see this as a failure).
+        - If Azure DevOps answers 404, the tool raises a RuntimeError saying the repository
+          was not found (the MCP host will see this as a failure).
 
         Parameters:
         - repo_key: Either the human-friendly repository name (e.g. "road-api") or the
           repository GUID (e.g. "7c9a1f2e-1234-4d5e-9abc-0f1122334455").
+        - project: Accepted for compatibility but ignored; the lookup always uses
+          `ADO_PROJECT`, like every other repository tool.
 
         Returns:
         - A string containing the **repository GUID** that can be safely passed to other tools
@@ -76,15 +133,16 @@ def resolve_repo_id(repo_key: str, project: Optional[str] = None) -> str:
         1. When the user mentions a repo by name, call `resolve_repo_id(repo_key="<name>")`.
         2. Use the returned GUID as `repo_id` in subsequent tools.
     """
-    return resolve_repo_id_internal(repo_key)
+    return await resolve_repo_id_internal(repo_key)
 
 
 @mcp.tool()
-def list_branches(
+async def list_branches(
     repo_id: str,
     filter_name: Optional[str] = None,
     top: int = 100,
-) -> List[Dict[str, Any]]:
+    include_counts: bool = False,
+) -> List[Branch]:
     """
     List branches in an Azure DevOps Git repository.
 
@@ -103,16 +161,22 @@ def list_branches(
     top : int, optional
         Maximum number of branches to return. Default is 100.
 
+    include_counts : bool, optional
+        Also return how many commits each branch is ahead of / behind the default
+        branch. Costs an extra request that Azure DevOps computes for every branch of
+        the repository, so only pass True when the counts are needed. Default is False.
+
     Returns:
     --------
-    List[Dict[str, Any]]
+    List[Branch]
         A list of branches, each containing:
         - name: Short branch name (e.g., "main", "feature/login")
         - fullName: Full ref name (e.g., "refs/heads/main") - use this for create_pull_request
         - isDefault: True if this is the default branch
         - creator: Display name of the person who created the branch
-        - aheadCount: Number of commits ahead of the default branch (if available)
-        - behindCount: Number of commits behind the default branch (if available)
+        With `include_counts=True` each branch also has:
+        - aheadCount: Number of commits ahead of the default branch (null if unavailable)
+        - behindCount: Number of commits behind the default branch (null if unavailable)
 
     Example Usage:
     --------------
@@ -126,35 +190,31 @@ def list_branches(
         list_branches(repo_id="<guid>", filter_name="feature/")
     """
     url = (
-        f"{ADO_ORG_URL}/_apis/git/repositories/{repo_id}/refs"
+        f"{GIT_REPOS_URL}/{repo_id}/refs"
         f"?filter=heads/&$top={top}&api-version=7.1-preview.1"
     )
-
-    resp = client.get(url)
-    resp.raise_for_status()
-
-    data = resp.json()
+    if filter_name:
+        # Filter on the server: only matching refs are sent, and `$top` applies
+        # to the matches instead of truncating the list before it is filtered.
+        url += f"&filterContains={quote(filter_name)}"
+
+    if include_counts:
+        # The stats do not depend on the refs, so both requests run concurrently
+        data, stats = await asyncio.gather(cached_get(url), _branch_stats(repo_id))
+    else:
+        data, stats = await cached_get(url), None
     refs = data.get("value", [])
 
-    result: List[Dict[str, Any]] = []
-
-    for ref in refs:
-        full_name = ref.get("name", "")
-        # Extract short name from refs/heads/xxx
-        short_name = full_name.replace("refs/heads/", "") if full_name.startswith("refs/heads/") else full_name
-
-        # Apply filter if specified
-        if filter_name and filter_name.lower() not in short_name.lower():
-            continue
-
-        creator = ref.get("creator", {})
+    branches = [_branch(ref) for ref in refs]
+    if filter_name:
+        # Keep the case-insensitive match on the short name as the contract
+        needle = filter_name.lower()
+        branches = [branch for branch in branches if needle in branch["name"].lower()]
 
-        result.append({
-            "name": short_name,
-            "fullName": full_name,
-            "isDefault": ref.get("isDefault", False),
-            "creator": creator.get("displayName") if creator else None,
-            "objectId": ref.get("objectId"),  # commit SHA
-        })
+    if stats is not None:
+        for branch in branches:
+            branch_stats = stats.get(branch["name"]) or EMPTY
+            branch["aheadCount"] = branch_stats.get("aheadCount")
+            branch["behindCount"] = branch_stats.get("behindCount")
 
-    return result
+    return branches
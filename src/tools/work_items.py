@@ -1,22 +1,165 @@
 """Work item-related MCP tools."""
-from typing import Dict, Any, Optional, List
-from ..config import mcp, ADO_ORG_URL
-from ..client import client
+import asyncio
+from typing import Dict, Any, Optional, List, Set, Union
+from urllib.parse import quote
+import httpx
+import orjson
+from typing_extensions import NotRequired, TypedDict
+from ..config import mcp, settings
+from ..client import get_client, dumps, loads, JSON_HEADERS, JSON_PATCH_HEADERS
+from ..cache import cached_get, STABLE_TTL
+from ..utils.helpers import EMPTY
+
+# Project metadata the work item tools are usually called with, in the order an
+# LLM discovers it; formatted with the quoted project (and node group and depth)
+_WORK_ITEM_TYPES_URL = f"{settings.org_url}/%s/_apis/wit/workitemtypes?api-version=7.1-preview.2"
+_CLASSIFICATION_NODES_URL = (
+    f"{settings.org_url}/%s/_apis/wit/classificationnodes/%s?$depth=%s&api-version=7.1-preview.2"
+)
+# Depth prefetched for area/iteration paths; the default depth of both tools
+PREFETCH_DEPTH = 3
+
+# Work item creation URL; formatted with the quoted project and work item type
+_WORK_ITEM_CREATE_URL = f"{settings.org_url}/%s/_apis/wit/workitems/$%s?api-version=7.1-preview.3"
+# Work item type path segments, already URL-quoted
+_PBI_TYPE = "Product%20Backlog%20Item"
+_BUGS_TYPE = "Bugs"
+
+# Batch endpoint that runs several work item requests in one round trip; each
+# sub-request addresses its work item relative to the organization URL.
+_WORK_ITEM_BATCH_URL = f"{settings.org_url}/_apis/wit/$batch?api-version=7.1"
+_BATCH_CREATE_URI = "/%s/_apis/wit/workitems/$%s?api-version=7.1"
+# Most sub-requests Azure DevOps accepts in one batch request
+WORK_ITEM_BATCH_SIZE = 200
+
+
+class CreatedWorkItem(TypedDict):
+    id: Optional[int]
+    url: Optional[str]
+    title: Optional[str]
+    state: Optional[str]
+    workItemType: Optional[str]
+    assignedTo: Optional[str]
+    areaPath: Optional[str]
+    iterationPath: Optional[str]
+
+
+class WorkItemError(TypedDict):
+    error: str
+
+
+# One entry of create_work_items_bulk's result
+WorkItemResult = Union[CreatedWorkItem, WorkItemError]
+
+
+class WorkItemSpec(TypedDict):
+    """One work item to create with `create_work_items_bulk`."""
+    work_item_type: str
+    title: str
+    assigned_to: str
+    description: NotRequired[str]
+    area_path: NotRequired[str]
+    iteration_path: NotRequired[str]
+    priority: NotRequired[int]
+    tags: NotRequired[str]
+    custom_fields: NotRequired[Dict[str, str]]
 
 
 def _flatten_classification_nodes(node: Dict[str, Any], result: List[Dict[str, Any]]) -> None:
-    """Recursively flatten a classification node tree into a list."""
-    result.append({
-        "path": node.get("path", ""),
-        "name": node.get("name", ""),
-        "id": node.get("id"),
-    })
-    for child in node.get("children", []):
-        _flatten_classification_nodes(child, result)
+    """Flatten a classification node tree into a list, parents before their children."""
+    # Explicit stack instead of recursion, so deep hierarchies cannot hit the recursion limit
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        result.append({
+            "path": node.get("path", ""),
+            "name": node.get("name", ""),
+            "id": node.get("id"),
+        })
+        # Reversed so the children come off the stack in their original order
+        stack.extend(reversed(node.get("children") or ()))
+
+
+def _field_operations(fields: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build the JSON Patch document that sets `fields` (reference name -> value) on a
+    new work item. Fields whose value is None are left out.
+    """
+    return [
+        {"op": "add", "path": f"/fields/{name}", "value": value}
+        for name, value in fields.items()
+        if value is not None
+    ]
+
+
+def _work_item_summary(work_item: Dict[str, Any]) -> CreatedWorkItem:
+    """Extract the fields returned by the work item create tools."""
+    fields = work_item.get("fields") or EMPTY
+
+    return {
+        "id": work_item.get("id"),
+        "url": ((work_item.get("_links") or EMPTY).get("html") or EMPTY).get("href"),
+        "title": fields.get("System.Title"),
+        "state": fields.get("System.State"),
+        "workItemType": fields.get("System.WorkItemType"),
+        "assignedTo": (fields.get("System.AssignedTo") or EMPTY).get("displayName"),
+        "areaPath": fields.get("System.AreaPath"),
+        "iterationPath": fields.get("System.IterationPath"),
+    }
+
+
+# Projects whose metadata has already been prefetched (once per process)
+_prefetched_projects: Set[str] = set()
+# Background prefetches still running; referenced so they are not garbage collected
+_prefetches: "Set[asyncio.Task[Any]]" = set()
+
+
+def _prefetch_project_metadata(project: str, requested: str) -> None:
+    """
+    On the first metadata call for `project`, start fetching the other two of its
+    work item types ("types"), area paths ("Areas") and iteration paths ("Iterations")
+    into the response cache without waiting for them. `requested` is the one the
+    calling tool fetches itself, at whatever depth it was asked for.
+
+    These are usually requested one after another before creating a work item,
+    so the follow-up calls are answered from the cache. Failures are ignored here;
+    the tool that actually needs the data reports them.
+    """
+    if project in _prefetched_projects:
+        return
+    _prefetched_projects.add(project)
+
+    quoted = quote(project)
+    urls = {
+        "types": _WORK_ITEM_TYPES_URL % quoted,
+        "Areas": _CLASSIFICATION_NODES_URL % (quoted, "Areas", PREFETCH_DEPTH),
+        "Iterations": _CLASSIFICATION_NODES_URL % (quoted, "Iterations", PREFETCH_DEPTH),
+    }
+    del urls[requested]
+    for url in urls.values():
+        task = asyncio.create_task(cached_get(url, ttl=STABLE_TTL))
+        _prefetches.add(task)
+        task.add_done_callback(_prefetch_done)
+
+
+def _prefetch_done(task: "asyncio.Task[Any]") -> None:
+    _prefetches.discard(task)
+    if not task.cancelled():
+        task.exception()  # mark a failure as handled instead of logging it as never retrieved
+
+
+def _raise_for_api_error(resp: httpx.Response) -> None:
+    """Raise with the Azure DevOps error details (not just the status) if `resp` failed."""
+    if resp.status_code >= 400:
+        try:
+            error_detail = loads(resp)
+        except Exception:
+            error_detail = resp.text
+        raise Exception(f"Azure DevOps API error {resp.status_code}: {error_detail}")
 
 
 @mcp.tool()
-def list_work_item_types(project: str) -> List[Dict[str, Any]]:
+async def list_work_item_types(project: str) -> List[Dict[str, Any]]:
     """
     List all available work item types in an Azure DevOps project.
 
@@ -43,15 +186,11 @@ def list_work_item_types(project: str) -> List[Dict[str, Any]]:
         "What work item types are available?"
         "Can I create bugs in this project?"
     """
-    url = (
-        f"{ADO_ORG_URL}/{project}/_apis/wit/workitemtypes"
-        f"?api-version=7.1-preview.2"
-    )
+    _prefetch_project_metadata(project, "types")
+    url = _WORK_ITEM_TYPES_URL % quote(project)
 
-    resp = client.get(url)
-    resp.raise_for_status()
-
-    data = resp.json()
+    # A cache hit if an earlier metadata call prefetched it
+    data = await cached_get(url, ttl=STABLE_TTL)
     types = data.get("value", [])
 
     result: List[Dict[str, Any]] = []
@@ -59,14 +198,14 @@ def list_work_item_types(project: str) -> List[Dict[str, Any]]:
         result.append({
             "name": wit.get("name"),
             "description": wit.get("description"),
-            "icon": wit.get("icon", {}).get("url"),
+            "icon": (wit.get("icon") or EMPTY).get("url"),
         })
 
     return result
 
 
 @mcp.tool()
-def list_area_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
+async def list_area_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
     """
     List all available area paths in an Azure DevOps project.
 
@@ -99,15 +238,10 @@ def list_area_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
         "Show me the available area paths"
         "Where can I put this backlog item?"
     """
-    url = (
-        f"{ADO_ORG_URL}/{project}/_apis/wit/classificationnodes/Areas"
-        f"?$depth={depth}&api-version=7.1-preview.2"
-    )
-
-    resp = client.get(url)
-    resp.raise_for_status()
+    _prefetch_project_metadata(project, "Areas")
+    url = _CLASSIFICATION_NODES_URL % (quote(project), "Areas", depth)
 
-    root = resp.json()
+    root = await cached_get(url, ttl=STABLE_TTL)
     result: List[Dict[str, Any]] = []
     _flatten_classification_nodes(root, result)
 
@@ -115,7 +249,7 @@ def list_area_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
 
 
 @mcp.tool()
-def list_iteration_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
+async def list_iteration_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
     """
     List all available iteration paths (sprints) in an Azure DevOps project.
 
@@ -145,15 +279,10 @@ def list_iteration_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
         "Show me the iterations"
         "Which sprint should I add this to?"
     """
-    url = (
-        f"{ADO_ORG_URL}/{project}/_apis/wit/classificationnodes/Iterations"
-        f"?$depth={depth}&api-version=7.1-preview.2"
-    )
-
-    resp = client.get(url)
-    resp.raise_for_status()
+    _prefetch_project_metadata(project, "Iterations")
+    url = _CLASSIFICATION_NODES_URL % (quote(project), "Iterations", depth)
 
-    root = resp.json()
+    root = await cached_get(url, ttl=STABLE_TTL)
     result: List[Dict[str, Any]] = []
     _flatten_classification_nodes(root, result)
 
@@ -161,7 +290,7 @@ def list_iteration_paths(project: str, depth: int = 3) -> List[Dict[str, Any]]:
 
 
 @mcp.tool()
-def create_product_backlog_item(
+async def create_product_backlog_item(
     project: str,
     title: str,
     assigned_to: str,
@@ -171,7 +300,7 @@ def create_product_backlog_item(
     iteration_path: Optional[str] = None,
     priority: Optional[int] = None,
     tags: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> CreatedWorkItem:
     """
     Create a new Product Backlog Item (PBI) in Azure DevOps.
 
@@ -218,12 +347,13 @@ def create_product_backlog_item(
 
     Returns:
     --------
-    Dict[str, Any]
+    CreatedWorkItem
         A dictionary containing the created PBI details:
         - id: The work item ID
         - url: Direct URL to the work item
         - title: The title
         - state: The initial state (usually "New")
+        - workItemType: The work item type
         - assignedTo: The person assigned
         - areaPath: The area path
         - iterationPath: The iteration path
@@ -246,94 +376,30 @@ def create_product_backlog_item(
             priority=2
         )
     """
-    url = (
-        f"{ADO_ORG_URL}/{project}/_apis/wit/workitems/$Product%20Backlog%20Item"
-        f"?api-version=7.1-preview.3"
-    )
+    url = _WORK_ITEM_CREATE_URL % (quote(project), _PBI_TYPE)
 
     # Build the JSON Patch document for work item creation
     # Azure DevOps uses JSON Patch format for work item operations
-    operations = [
-        {
-            "op": "add",
-            "path": "/fields/System.Title",
-            "value": title,
-        }
-    ]
-
-    if description is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.Description",
-            "value": description,
-        })
-
-    if acceptance_criteria is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/Microsoft.VSTS.Common.AcceptanceCriteria",
-            "value": acceptance_criteria,
-        })
-
-    if area_path is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.AreaPath",
-            "value": area_path,
-        })
-
-    if iteration_path is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.IterationPath",
-            "value": iteration_path,
-        })
-
-    # assigned_to is required
-    operations.append({
-        "op": "add",
-        "path": "/fields/System.AssignedTo",
-        "value": assigned_to,
+    operations = _field_operations({
+        "System.Title": title,
+        "System.Description": description,
+        "Microsoft.VSTS.Common.AcceptanceCriteria": acceptance_criteria,
+        "System.AreaPath": area_path,
+        "System.IterationPath": iteration_path,
+        "System.AssignedTo": assigned_to,
+        "Microsoft.VSTS.Common.Priority": priority,
+        "System.Tags": tags,
     })
 
-    if priority is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/Microsoft.VSTS.Common.Priority",
-            "value": priority,
-        })
-
-    if tags is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.Tags",
-            "value": tags,
-        })
-
     # Azure DevOps work item API requires application/json-patch+json content type
-    headers = {"Content-Type": "application/json-patch+json"}
-
-    resp = client.post(url, json=operations, headers=headers)
-    resp.raise_for_status()
+    resp = await get_client().post(url, content=dumps(operations), headers=JSON_PATCH_HEADERS)
+    _raise_for_api_error(resp)
 
-    work_item = resp.json()
-
-    # Extract relevant fields from the response
-    fields = work_item.get("fields", {})
-
-    return {
-        "id": work_item.get("id"),
-        "url": work_item.get("_links", {}).get("html", {}).get("href"),
-        "title": fields.get("System.Title"),
-        "state": fields.get("System.State"),
-        "assignedTo": (fields.get("System.AssignedTo") or {}).get("displayName"),
-        "areaPath": fields.get("System.AreaPath"),
-        "iterationPath": fields.get("System.IterationPath"),
-    }
+    return _work_item_summary(loads(resp))
 
 
 @mcp.tool()
-def create_bug(
+async def create_bug(
     project: str,
     title: str,
     assigned_to: str,
@@ -345,7 +411,7 @@ def create_bug(
     iteration_path: Optional[str] = None,
     priority: Optional[int] = None,
     tags: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> CreatedWorkItem:
     """
     Create a new Bug work item in Azure DevOps (using custom "Bugs" type).
 
@@ -396,12 +462,13 @@ def create_bug(
 
     Returns:
     --------
-    Dict[str, Any]
+    CreatedWorkItem
         A dictionary containing the created bug details:
         - id: The work item ID
         - url: Direct URL to the work item
         - title: The title
         - state: The initial state (usually "New")
+        - workItemType: The work item type
         - assignedTo: The person assigned
         - areaPath: The area path
         - iterationPath: The iteration path
@@ -426,108 +493,31 @@ def create_bug(
         )
     """
     # Use custom "Bugs" work item type (not standard "Bug")
-    url = (
-        f"{ADO_ORG_URL}/{project}/_apis/wit/workitems/$Bugs"
-        f"?api-version=7.1-preview.3"
-    )
-
-    operations = [
-        {
-            "op": "add",
-            "path": "/fields/System.Title",
-            "value": title,
-        }
-    ]
-
-    # assigned_to is required
-    operations.append({
-        "op": "add",
-        "path": "/fields/System.AssignedTo",
-        "value": assigned_to,
+    url = _WORK_ITEM_CREATE_URL % (quote(project), _BUGS_TYPE)
+
+    operations = _field_operations({
+        "System.Title": title,
+        "System.AssignedTo": assigned_to,
+        "System.Description": description,
+        # Custom required fields for "Bugs" type
+        "Custom.Environment": environment,
+        "Custom.Stepstoreproduce": steps_to_reproduce,
+        "Custom.Expectedappbehavior": expected_behavior,
+        "System.AreaPath": area_path,
+        "System.IterationPath": iteration_path,
+        "Microsoft.VSTS.Common.Priority": priority,
+        "System.Tags": tags,
     })
 
-    # Description is required for Bugs type
-    operations.append({
-        "op": "add",
-        "path": "/fields/System.Description",
-        "value": description,
-    })
+    resp = await get_client().post(url, content=dumps(operations), headers=JSON_PATCH_HEADERS)
 
-    # Custom required fields for "Bugs" type
-    operations.append({
-        "op": "add",
-        "path": "/fields/Custom.Environment",
-        "value": environment,
-    })
-
-    operations.append({
-        "op": "add",
-        "path": "/fields/Custom.Stepstoreproduce",
-        "value": steps_to_reproduce,
-    })
-
-    operations.append({
-        "op": "add",
-        "path": "/fields/Custom.Expectedappbehavior",
-        "value": expected_behavior,
-    })
-
-    if area_path is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.AreaPath",
-            "value": area_path,
-        })
-
-    if iteration_path is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.IterationPath",
-            "value": iteration_path,
-        })
+    _raise_for_api_error(resp)
 
-    if priority is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/Microsoft.VSTS.Common.Priority",
-            "value": priority,
-        })
-
-    if tags is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.Tags",
-            "value": tags,
-        })
-
-    headers = {"Content-Type": "application/json-patch+json"}
-
-    resp = client.post(url, json=operations, headers=headers)
-
-    # Better error handling to see Azure DevOps error details
-    if resp.status_code >= 400:
-        try:
-            error_detail = resp.json()
-        except Exception:
-            error_detail = resp.text
-        raise Exception(f"Azure DevOps API error {resp.status_code}: {error_detail}")
-
-    bug_item = resp.json()
-    bug_fields = bug_item.get("fields", {})
-
-    return {
-        "id": bug_item.get("id"),
-        "url": bug_item.get("_links", {}).get("html", {}).get("href"),
-        "title": bug_fields.get("System.Title"),
-        "state": bug_fields.get("System.State"),
-        "assignedTo": (bug_fields.get("System.AssignedTo") or {}).get("displayName"),
-        "areaPath": bug_fields.get("System.AreaPath"),
-        "iterationPath": bug_fields.get("System.IterationPath"),
-    }
+    return _work_item_summary(loads(resp))
 
 
 @mcp.tool()
-def create_work_item(
+async def create_work_item(
     project: str,
     work_item_type: str,
     title: str,
@@ -538,7 +528,7 @@ def create_work_item(
     priority: Optional[int] = None,
     tags: Optional[str] = None,
     custom_fields: Optional[Dict[str, str]] = None,
-) -> Dict[str, Any]:
+) -> CreatedWorkItem:
     """
     Create a work item of ANY type in Azure DevOps.
 
@@ -630,95 +620,144 @@ def create_work_item(
             }
         )
     """
-    # URL-encode the work item type (spaces become %20)
-    encoded_type = work_item_type.replace(" ", "%20")
+    # URL-encode the work item type, including any "/" or "&" in its name
+    url = _WORK_ITEM_CREATE_URL % (quote(project), quote(work_item_type, safe=""))
+
+    operations = _field_operations({
+        "System.Title": title,
+        "System.AssignedTo": assigned_to,
+        "System.Description": description,
+        "System.AreaPath": area_path,
+        "System.IterationPath": iteration_path,
+        "Microsoft.VSTS.Common.Priority": priority,
+        "System.Tags": tags,
+        # Custom fields if provided (for project-specific required fields)
+        **(custom_fields or {}),
+    })
 
-    url = (
-        f"{ADO_ORG_URL}/{project}/_apis/wit/workitems/${encoded_type}"
-        f"?api-version=7.1-preview.3"
-    )
+    resp = await get_client().post(url, content=dumps(operations), headers=JSON_PATCH_HEADERS)
 
-    operations = [
-        {
-            "op": "add",
-            "path": "/fields/System.Title",
-            "value": title,
-        }
-    ]
+    _raise_for_api_error(resp)
 
-    # assigned_to is required
-    operations.append({
-        "op": "add",
-        "path": "/fields/System.AssignedTo",
-        "value": assigned_to,
-    })
+    return _work_item_summary(loads(resp))
 
-    if description is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.Description",
-            "value": description,
-        })
 
-    if area_path is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.AreaPath",
-            "value": area_path,
-        })
+def _batch_create_request(project: str, item: WorkItemSpec) -> Dict[str, Any]:
+    """Build the `$batch` sub-request that creates `item`."""
+    return {
+        "method": "PATCH",
+        "uri": _BATCH_CREATE_URI % (quote(project), quote(item["work_item_type"], safe="")),
+        "headers": JSON_PATCH_HEADERS,
+        "body": _field_operations({
+            "System.Title": item["title"],
+            "System.AssignedTo": item["assigned_to"],
+            "System.Description": item.get("description"),
+            "System.AreaPath": item.get("area_path"),
+            "System.IterationPath": item.get("iteration_path"),
+            "Microsoft.VSTS.Common.Priority": item.get("priority"),
+            "System.Tags": item.get("tags"),
+            **(item.get("custom_fields") or {}),
+        }),
+    }
 
-    if iteration_path is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.IterationPath",
-            "value": iteration_path,
-        })
 
-    if priority is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/Microsoft.VSTS.Common.Priority",
-            "value": priority,
-        })
+def _sub_response_result(sub: Dict[str, Any]) -> WorkItemResult:
+    """Shape one `$batch` sub-response: the created work item, or its error."""
+    # Sub-response bodies arrive as JSON-encoded strings
+    body = sub.get("body")
+    if isinstance(body, str):
+        try:
+            body = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
 
-    if tags is not None:
-        operations.append({
-            "op": "add",
-            "path": "/fields/System.Tags",
-            "value": tags,
-        })
+    code = sub.get("code", 200)
+    if code >= 400:
+        # The batch is not transactional: report the failure and keep the created items
+        return {"error": f"Azure DevOps API error {code}: {body}"}
+    if not isinstance(body, dict):
+        return {"error": f"Unexpected response for status {code}: {body!r}"}
+    return _work_item_summary(body)
 
-    # Add custom fields if provided (for project-specific required fields)
-    if custom_fields is not None:
-        for field_name, field_value in custom_fields.items():
-            operations.append({
-                "op": "add",
-                "path": f"/fields/{field_name}",
-                "value": field_value,
-            })
 
-    headers = {"Content-Type": "application/json-patch+json"}
+async def _create_batch(requests: List[Dict[str, Any]]) -> List[WorkItemResult]:
+    """
+    Send one `$batch` request and shape each sub-response, in request order.
 
-    resp = client.post(url, json=operations, headers=headers)
+    Never raises for a failed request: every item of the batch then gets an error
+    entry, so the results of other batches (whose items already exist) are kept.
+    """
+    try:
+        resp = await get_client().post(_WORK_ITEM_BATCH_URL, content=dumps(requests), headers=JSON_HEADERS)
+    except httpx.HTTPError as exc:
+        # After a timeout the items may exist anyway; say so instead of inviting a blind retry
+        message = f"Batch request failed, the work item may or may not have been created: {exc}"
+        return [{"error": message} for _ in requests]
+
+    try:
+        _raise_for_api_error(resp)
+        subs = loads(resp).get("value", [])
+    except Exception as exc:
+        if 400 <= resp.status_code < 500:
+            # The batch was rejected as a whole, before any sub-request ran
+            message = f"Batch request rejected, the work item was not created: {exc}"
+        else:
+            message = f"Batch request failed, the work item may or may not have been created: {exc}"
+        return [{"error": message} for _ in requests]
+
+    results = [_sub_response_result(sub) for sub in subs[:len(requests)]]
+    results += [
+        {"error": "Azure DevOps returned no response for this work item"}
+        for _ in range(len(requests) - len(results))
+    ]
+    return results
 
-    # Better error handling to see Azure DevOps error details
-    if resp.status_code >= 400:
-        try:
-            error_detail = resp.json()
-        except Exception:
-            error_detail = resp.text
-        raise Exception(f"Azure DevOps API error {resp.status_code}: {error_detail}")
 
-    work_item = resp.json()
-    fields = work_item.get("fields", {})
+@mcp.tool()
+async def create_work_items_bulk(project: str, items: List[WorkItemSpec]) -> List[WorkItemResult]:
+    """
+    Create several work items of ANY type in one request.
 
-    return {
-        "id": work_item.get("id"),
-        "url": work_item.get("_links", {}).get("html", {}).get("href"),
-        "title": fields.get("System.Title"),
-        "state": fields.get("System.State"),
-        "workItemType": fields.get("System.WorkItemType"),
-        "assignedTo": (fields.get("System.AssignedTo") or {}).get("displayName"),
-        "areaPath": fields.get("System.AreaPath"),
-        "iterationPath": fields.get("System.IterationPath"),
-    }
\ No newline at end of file
+    Use this instead of repeated create_work_item calls when the user asks for more
+    than one work item at once (e.g. a PBI and its tasks). Follow the same workflow
+    as create_work_item: discover the project and work item types first.
+
+    Parameters:
+    -----------
+    project : str
+        REQUIRED. The project name.
+
+    items : List[WorkItemSpec]
+        REQUIRED. The work items to create. Each item takes the parameters of
+        create_work_item: work_item_type, title and assigned_to (required), and
+        optionally description, area_path, iteration_path, priority, tags and
+        custom_fields.
+
+    Returns:
+    --------
+    List[CreatedWorkItem | WorkItemError]
+        One entry per item, in the same order:
+        - on success: id, url, title, state, workItemType, assignedTo, areaPath, iterationPath
+        - on failure: error, with the Azure DevOps status code and message
+
+        Items are created independently: one failing item (or one failed batch of
+        up to 200 items) does not prevent the others from being created. Check the
+        errors before retrying, so items that were created are not duplicated.
+
+    Example call:
+        create_work_items_bulk(
+            project="MyProject",
+            items=[
+                {"work_item_type": "Task", "title": "Add login form", "assigned_to": "john@company.com"},
+                {"work_item_type": "Task", "title": "Add login API", "assigned_to": "jane@company.com"},
+            ]
+        )
+    """
+    requests = [_batch_create_request(project, item) for item in items]
+
+    # Large lists are split into batches of WORK_ITEM_BATCH_SIZE, sent concurrently
+    batches = await asyncio.gather(*(
+        _create_batch(requests[start:start + WORK_ITEM_BATCH_SIZE])
+        for start in range(0, len(requests), WORK_ITEM_BATCH_SIZE)
+    ))
+    return [result for batch in batches for result in batch]
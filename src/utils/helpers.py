@@ -1,42 +1,80 @@
 """Helper functions for Azure DevOps operations."""
+import asyncio
+import io
 import re
-from typing import Optional
-from ..client import client
-from ..config import ADO_ORG_URL, ADO_PROJECT
+import zipfile
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional
+from urllib.parse import quote
+import httpx
+from ..client import get_client, dumps, JSON_HEADERS
+from ..cache import cached_get, get_blob, put_blob, STABLE_TTL, VOLATILE_TTL
+from ..config import settings, PROJECTS_URL, PROJECT_GIT_REPOS_URL
 
+BLOB_CHUNK_SIZE = 64 * 1024
+# Blobs above this size are not downloaded in full, decoded or diffed
+MAX_BLOB_BYTES = 512 * 1024
+# Stand-ins returned (and cached) instead of the text of binary or oversized blobs.
+# Both contain a NUL, which never occurs in a decoded text blob.
+BINARY_BLOB = "\0<binary>"
+LARGE_BLOB = "\0<too large>"
 
-def resolve_repo_id_internal(repo_key: str) -> str:
+# Shared read-only stand-in for missing nested objects in API responses, used as
+# `(obj.get(key) or EMPTY).get(...)` instead of allocating a new `{}` per lookup
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# URL templates, built once at import; called once per blob in the diff fan-out
+_REPO_URL = f"{PROJECT_GIT_REPOS_URL}/%s?api-version=7.1-preview.1"
+_PROJECT_URL = f"{PROJECTS_URL}/%s?api-version=7.1-preview.4"
+_ITERATIONS_URL = (
+    f"{PROJECT_GIT_REPOS_URL}/%s/pullRequests/%s/iterations?includeCommits=false&api-version=7.1-preview.1"
+)
+_BLOB_URL = f"{PROJECT_GIT_REPOS_URL}/%s/blobs/%s?api-version=7.1-preview.1&download=true&$format=text"
+_BLOBS_BATCH_URL = f"{PROJECT_GIT_REPOS_URL}/%s/blobs?api-version=7.1-preview.1"
+_BLOBS_BATCH_HEADERS = {**JSON_HEADERS, "Accept": "application/zip"}
+# Upper bound on individual blob downloads in flight when the batch request falls short
+BLOB_FETCH_CONCURRENCY = 16
+
+
+_GUID_RE = re.compile(r"[0-9a-fA-F-]{36}")
+
+
+async def resolve_repo_id_internal(repo_key: str) -> str:
     """
     If repo_key is already a GUID -> return as-is.
-    If repo_key is a name -> call /repositories and find the matching repo, return its id.
+    If repo_key is a name -> call /repositories/{name} and return the repo's id.
     """
     # Very simple GUID check
-    if re.fullmatch(r"[0-9a-fA-F-]{36}", repo_key):
+    if _GUID_RE.fullmatch(repo_key):
         return repo_key
 
-    url = f"{ADO_ORG_URL}/{ADO_PROJECT}/_apis/git/repositories?api-version=7.1-preview.1"
-    resp = client.get(url)
-    resp.raise_for_status()
+    # Azure DevOps looks the name up itself and returns just that repository, instead
+    # of the whole project listing being downloaded and scanned. Names match
+    # case-insensitively, so the URL is lowercased to share one cache entry per
+    # repository; the entry expires, so a renamed or recreated repo is picked up.
+    try:
+        repo = await cached_get(_REPO_URL % quote(repo_key.lower(), safe=""), ttl=STABLE_TTL)
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 404:
+            raise RuntimeError(
+                f"Could not find repository with name '{repo_key}' in project '{settings.project}'"
+            ) from None
+        raise
+
+    return repo["id"]
 
-    data = resp.json()
-    for repo in data.get("value", []):
-        if repo["name"] == repo_key:
-            return repo["id"]
 
-    raise RuntimeError(f"Could not find repository with name '{repo_key}' in project '{ADO_PROJECT}'")
+async def get_project_id(project: str) -> str:
+    """Resolve a project name to its GUID."""
+    # Project names match case-insensitively, so every spelling shares one cache entry
+    data = await cached_get(_PROJECT_URL % quote(project.lower()), ttl=STABLE_TTL)
+    return data["id"]
 
 
-def get_latest_iteration_id(repo_id: str, pr_id: int) -> int:
+async def get_latest_iteration_id(repo_id: str, pr_id: int) -> int:
     """Get the latest iteration id for a pull request."""
-    url = (
-        f"{ADO_ORG_URL}/{ADO_PROJECT}"
-        f"/_apis/git/repositories/{repo_id}/pullRequests/{pr_id}/iterations"
-        f"?api-version=7.1-preview.1"
-    )
-    resp = client.get(url)
-    resp.raise_for_status()
-
-    data = resp.json()
+    url = _ITERATIONS_URL % (repo_id, pr_id)
+    data = await cached_get(url, ttl=VOLATILE_TTL)
     iterations = data.get("value", [])
     if not iterations:
         raise RuntimeError(f"No iterations found for PR #{pr_id}")
@@ -46,18 +84,97 @@ def get_latest_iteration_id(repo_id: str, pr_id: int) -> int:
     return iteration_id
 
 
-def get_blob_text(repo_id: str, object_id: Optional[str]) -> str:
-    """Fetch the raw text content of a blob (file version) by its object ID."""
+def _blob_text(data: bytes) -> str:
+    """Decode a blob once, or return a stand-in if it is too large or binary."""
+    if len(data) > MAX_BLOB_BYTES:
+        return LARGE_BLOB
+    # Same heuristic as git: a NUL byte near the start means binary content
+    if b"\0" in data[:8192]:
+        return BINARY_BLOB
+    return data.decode("utf-8", errors="replace")
+
+
+async def get_blob_text(repo_id: str, object_id: Optional[str]) -> str:
+    """
+    Fetch the raw text content of a blob (file version) by its object ID.
+
+    Returns BINARY_BLOB or LARGE_BLOB instead of the text for binary files and
+    files over MAX_BLOB_BYTES; the download stops as soon as that is known.
+    """
     if not object_id:
         return ""
 
-    url = (
-        f"{ADO_ORG_URL}/{ADO_PROJECT}"
-        f"/_apis/git/repositories/{repo_id}/blobs/{object_id}"
-        f"?api-version=7.1-preview.1&download=true&$format=text"
-    )
-    resp = client.get(url)
-    if resp.status_code != 200:
-        return ""
+    cached = get_blob(object_id)
+    if cached is not None:
+        return cached
+
+    url = _BLOB_URL % (repo_id, object_id)
+    # Stream the body into one buffer and decode it once, instead of letting
+    # httpx hold the raw bytes and a separately decoded `resp.text` copy.
+    body = bytearray()
+    async with get_client().stream("GET", url) as resp:
+        if resp.status_code != 200:
+            return ""
+        async for chunk in resp.aiter_bytes(BLOB_CHUNK_SIZE):
+            body += chunk
+            if len(body) > MAX_BLOB_BYTES or b"\0" in body[:8192]:
+                break
+
+    text = _blob_text(body)
+    put_blob(object_id, text)
+    return text
+
+
+async def get_blob_texts(repo_id: str, object_ids: Iterable[Optional[str]]) -> Dict[str, str]:
+    """
+    Fetch the text of many blobs at once, keyed by object ID.
+
+    Blobs already in the blob cache are served from it. The remaining IDs are
+    requested in a single POST to the blobs batch endpoint, which returns a zip
+    archive with one entry per blob. Any blob missing from the archive (or every
+    blob, if the batch request fails) is fetched individually.
+    """
+    texts: Dict[str, str] = {}
+    ids = []
+    for oid in dict.fromkeys(oid for oid in object_ids if oid):
+        cached = get_blob(oid)
+        if cached is not None:
+            texts[oid] = cached
+        else:
+            ids.append(oid)
+    if not ids:
+        return texts
+
+    url = _BLOBS_BATCH_URL % repo_id
+    try:
+        # Blob sizes are not known up front, so the archive still carries oversized
+        # blobs in full and all of it is held in `resp.content`; MAX_BLOB_BYTES only
+        # saves decompressing and decoding them. The individual fallback below is
+        # the path that stops downloading early.
+        resp = await get_client().post(url, content=dumps(ids), headers=_BLOBS_BATCH_HEADERS)
+        if resp.status_code == 200:
+            wanted = set(ids)
+            with zipfile.ZipFile(io.BytesIO(resp.content)) as archive:
+                for info in archive.infolist():
+                    # Entries are named after the blob's object ID
+                    object_id = info.filename.rsplit("/", 1)[-1]
+                    if object_id in wanted:
+                        # The zip header has the size, so large blobs are not decompressed
+                        text = LARGE_BLOB if info.file_size > MAX_BLOB_BYTES else _blob_text(archive.read(info))
+                        put_blob(object_id, text)
+                        texts[object_id] = text
+    except (httpx.HTTPError, zipfile.BadZipFile):
+        pass
+
+    missing = [oid for oid in ids if oid not in texts]
+    if missing:
+        semaphore = asyncio.Semaphore(BLOB_FETCH_CONCURRENCY)
+
+        async def fetch(oid: str) -> str:
+            async with semaphore:
+                return await get_blob_text(repo_id, oid)
+
+        fetched = await asyncio.gather(*(fetch(oid) for oid in missing))
+        texts.update(zip(missing, fetched))
 
-    return resp.text
+    return texts